@@ -2,14 +2,392 @@ import sys
 import os
 import shutil
 import re
+import io
+import json
+import hashlib
+import hmac
+import tempfile
+import time
+import asyncio
+import argparse
+import queue
+import sqlite3
+import threading
+import itertools
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from http import HTTPStatus
 import requests
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QLabel, QLineEdit, QPushButton, QCheckBox, QGroupBox,
                                QTableWidget, QTableWidgetItem, QMessageBox, QStatusBar, QFileDialog,
-                               QListWidget, QListWidgetItem, QComboBox, QDialog, QFormLayout)
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+                               QListWidget, QListView, QComboBox, QDialog, QFormLayout)
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QTimer, QAbstractListModel, QModelIndex
 from mutagen.easyid3 import EasyID3
-from mutagen.mp4 import MP4
+from mutagen.id3 import APIC
+from mutagen.mp4 import MP4, MP4Cover
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+WORK_CACHE_SIZE = 1024
+PREFETCH_NEIGHBORS = 3
+PREFETCH_WINDOW = 50
+SEARCH_CACHE_SIZE = 256
+SEARCH_DEBOUNCE_MS = 400
+SEARCH_WORKERS = 4
+MAX_SEARCH_RESULTS = 5
+HTTP_TIMEOUT = (5, 15)
+OPEN_LIBRARY_SEARCH_URL = "https://openlibrary.org/search.json"
+OPEN_LIBRARY_SEARCH_FIELDS = "key,title,author_name,first_publish_year,cover_i"
+OPEN_LIBRARY_COVER_URL = "https://covers.openlibrary.org/b/id/{cover_id}-L.jpg?default=false"
+GOOGLE_BOOKS_VOLUMES_URL = "https://www.googleapis.com/books/v1/volumes"
+GOOGLE_BOOKS_FIELDS = "items(volumeInfo(title,authors,publishedDate,imageLinks/thumbnail))"
+COVER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'audiobook-organizer', 'covers')
+COVER_MAX_SIZE = 600
+COVER_JPEG_QUALITY = 85
+COVER_WORKERS = 8
+COVER_BATCH_SIZE = 64
+COVER_MISS_TTL = 3600
+COVER_MISS_STATUSES = (HTTPStatus.NOT_FOUND, HTTPStatus.GONE)
+PIPELINE_QUEUE_SIZE = 256
+SPILL_THRESHOLD = 10000
+PREVIEW_ROW_LIMIT = 1000
+REVIEW_BLOCK_SIZE = 256
+METADATA_FIELDS = ['artist', 'title', 'album', 'tracknumber', 'year', 'genre', 'ext']
+DEFAULT_EXTENSIONS = ['.mp3', '.m4a', '.m4b', '.aac']
+DEFAULT_PATTERN = "{artist}/{album}/{title}/{title}.{ext}"
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_WORKERS = 4
+SERVICE_MAX_BODY = 1024 * 1024
+SERVICE_TOKEN_ENV = "ORGANIZER_SERVICE_TOKEN"
+
+class LRUCache:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+class SpillDict(MutableMapping):
+    def __init__(self, threshold=SPILL_THRESHOLD):
+        self.threshold = threshold
+        self._memory = {}
+        self._db = None
+
+    def _spill(self):
+        self._db = sqlite3.connect('', check_same_thread=False)
+        self._db.execute('CREATE TABLE items (key TEXT PRIMARY KEY, value TEXT)')
+        self._db.executemany('INSERT INTO items (key, value) VALUES (?, ?)',
+                             ((key, json.dumps(value)) for key, value in self._memory.items()))
+        self._memory = None
+
+    def __getitem__(self, key):
+        if self._db is None:
+            return self._memory[key]
+        row = self._db.execute('SELECT value FROM items WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __setitem__(self, key, value):
+        if self._db is None:
+            self._memory[key] = value
+            if len(self._memory) > self.threshold:
+                self._spill()
+            return
+        self._db.execute('INSERT INTO items (key, value) VALUES (?, ?) '
+                         'ON CONFLICT(key) DO UPDATE SET value = excluded.value', (key, json.dumps(value)))
+
+    def __delitem__(self, key):
+        if self._db is None:
+            del self._memory[key]
+            return
+        if self._db.execute('DELETE FROM items WHERE key = ?', (key,)).rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self):
+        if self._db is None:
+            return iter(list(self._memory))
+        return (key for (key,) in self._db.execute('SELECT key FROM items ORDER BY rowid'))
+
+    def __len__(self):
+        if self._db is None:
+            return len(self._memory)
+        return self._db.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def keys_slice(self, start, count):
+        if self._db is None:
+            return list(itertools.islice(self._memory, start, start + count))
+        return [key for (key,) in self._db.execute('SELECT key FROM items ORDER BY rowid LIMIT ? OFFSET ?',
+                                                   (count, start))]
+
+    def keys_after(self, key, count):
+        if key is None:
+            return self.keys_slice(0, count)
+        if self._db is None:
+            keys = iter(self._memory)
+            for candidate in keys:
+                if candidate == key:
+                    break
+            return list(itertools.islice(keys, count))
+        return [key for (key,) in self._db.execute('SELECT key FROM items WHERE rowid > '
+                                                   '(SELECT rowid FROM items WHERE key = ?) ORDER BY rowid LIMIT ?',
+                                                   (key, count))]
+
+    def items(self):
+        if self._db is None:
+            return list(self._memory.items())
+        return ((key, json.loads(value)) for key, value in self._db.execute('SELECT key, value FROM items ORDER BY rowid'))
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self._memory = {}
+
+class TrackRecord:
+    __slots__ = ['path'] + METADATA_FIELDS
+
+    def __init__(self, path, metadata):
+        self.path = path
+        for field in METADATA_FIELDS:
+            value = str(metadata.get(field, 'Unknown'))
+            setattr(self, field, value)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in METADATA_FIELDS}
+
+    def is_missing_metadata(self):
+        return self.artist == 'Unknown' or self.title == 'Unknown' or self.album == 'Unknown'
+
+work_cache = LRUCache(WORK_CACHE_SIZE)
+search_cache = LRUCache(SEARCH_CACHE_SIZE)
+http_local = threading.local()
+
+def http_session():
+    session = getattr(http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers['Accept-Encoding'] = 'gzip'
+        http_local.session = session
+    return session
+
+def http_get(url, params=None):
+    response = http_session().get(url, params=params, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+def build_open_library_query(title='', author='', series=''):
+    query_parts = []
+    if title:
+        query_parts.append(f'title:"{title}"')
+    if author:
+        query_parts.append(f'author:"{author}"')
+    if series:
+        query_parts.append(f'series:"{series}"')
+    return {
+        'q': ' '.join(query_parts),
+        'fields': OPEN_LIBRARY_SEARCH_FIELDS,
+        'limit': MAX_SEARCH_RESULTS
+    }
+
+def build_google_books_query(title='', author='', api_key=None):
+    query_parts = []
+    if title:
+        query_parts.append(f'intitle:"{title}"')
+    if author:
+        query_parts.append(f'inauthor:"{author}"')
+    params = {
+        'q': ' '.join(query_parts),
+        'fields': GOOGLE_BOOKS_FIELDS,
+        'maxResults': MAX_SEARCH_RESULTS
+    }
+    if api_key:
+        params['key'] = api_key
+    return params
+
+def open_library_book_metadata(title, authors, published, series='', cover_id=None):
+    year_match = re.search(r'\d{4}', str(published)) if published else None
+    return {
+        'title': title,
+        'authors': authors,
+        'publishedDate': year_match.group(0) if year_match else 'Unknown',
+        'series': series,
+        'cover_id': cover_id,
+        'source': 'Open Library'
+    }
+
+def open_library_doc_metadata(doc, authors):
+    return open_library_book_metadata(doc.get('title'), authors, doc.get('first_publish_year'),
+                                      cover_id=doc.get('cover_i'))
+
+def google_books_cover_url(volumeInfo):
+    thumbnail = volumeInfo.get('imageLinks', {}).get('thumbnail')
+    if not thumbnail:
+        return None
+    return thumbnail.replace('http://', 'https://', 1)
+
+def cover_url(book_metadata):
+    if book_metadata.get('cover_id'):
+        return OPEN_LIBRARY_COVER_URL.format(cover_id=book_metadata['cover_id'])
+    return book_metadata.get('cover_url')
+
+def image_mime(data):
+    if data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if data.startswith(b'\xff\xd8'):
+        return 'image/jpeg'
+    return None
+
+def normalize_cover(data):
+    if Image is None:
+        return data if image_mime(data) else None
+    try:
+        image = Image.open(io.BytesIO(data)).convert('RGB')
+    except (OSError, ValueError) as e:
+        print(f"Error decoding cover: {e}")
+        return None
+    image.thumbnail((COVER_MAX_SIZE, COVER_MAX_SIZE))
+    output = io.BytesIO()
+    image.save(output, format='JPEG', quality=COVER_JPEG_QUALITY, optimize=True)
+    return output.getvalue()
+
+def download_cover(url):
+    response = http_session().get(url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return normalize_cover(response.content)
+
+class CoverCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def _index_path(self, url):
+        return os.path.join(self.cache_dir, 'urls', hashlib.sha256(url.encode()).hexdigest())
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, 'blobs', digest[:2], digest)
+
+    def _miss_path(self, url):
+        return os.path.join(self.cache_dir, 'misses', hashlib.sha256(url.encode()).hexdigest())
+
+    def is_recent_miss(self, url):
+        try:
+            return time.time() - os.path.getmtime(self._miss_path(url)) < COVER_MISS_TTL
+        except OSError:
+            return False
+
+    def record_miss(self, url):
+        try:
+            self._write(self._miss_path(url), b'')
+        except OSError as e:
+            print(f"Error recording cover miss for {url}: {e}")
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, url):
+        return os.path.exists(self._index_path(url)) or self.is_recent_miss(url)
+
+    def lookup(self, url):
+        try:
+            with open(self._index_path(url)) as f:
+                digest = f.read().strip()
+            with open(self._blob_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url, data):
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            self._write(blob_path, data)
+        self._write(self._index_path(url), digest.encode())
+
+    def get(self, url):
+        data = self.lookup(url)
+        if data is not None or self.is_recent_miss(url):
+            return data
+        with self._lock:
+            future = self._inflight.get(url)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[url] = future
+        if not owner:
+            return future.result()
+        data = None
+        try:
+            data = download_cover(url)
+            if data:
+                self.store(url, data)
+            else:
+                self.record_miss(url)
+        except requests.HTTPError as e:
+            print(f"Error fetching cover {url}: {e}")
+            data = None
+            if e.response is not None and e.response.status_code in COVER_MISS_STATUSES:
+                self.record_miss(url)
+        except Exception as e:
+            print(f"Error fetching cover {url}: {e}")
+            data = None
+        finally:
+            future.set_result(data)
+            with self._lock:
+                del self._inflight[url]
+        return data
+
+cover_cache = CoverCache(COVER_CACHE_DIR)
+
+def fetch_cover(book_metadata):
+    url = cover_url(book_metadata)
+    return cover_cache.get(url) if url else None
+
+def fetch_covers(book_metadatas):
+    urls = list(dict.fromkeys(url for url in map(cover_url, book_metadatas) if url))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=COVER_WORKERS) as pool:
+        return dict(zip(urls, pool.map(cover_cache.get, urls)))
+
+def get_id3_cover(id3, key):
+    frames = id3.getall('APIC')
+    if not frames:
+        raise KeyError(key)
+    return [frame.data for frame in frames]
+
+def set_id3_cover(id3, key, value):
+    id3.setall('APIC', [APIC(encoding=3, mime=image_mime(value[0]), type=3, desc='Cover', data=value[0])])
+
+EasyID3.RegisterKey('coverart', get_id3_cover, set_id3_cover)
 
 def sanitize_filename(name):
     invalid_chars = '<>:"/\\|?*'
@@ -43,6 +421,123 @@ def extract_metadata(file_path):
     metadata['ext'] = ext
     return metadata
 
+def iter_audio_files(input_dir, extensions):
+    for root, _, filenames in os.walk(input_dir):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in extensions:
+                yield os.path.join(root, filename)
+
+def read_track_record(file_path):
+    return TrackRecord(file_path, extract_metadata(file_path))
+
+def run_pipeline(source, *stages, maxsize=PIPELINE_QUEUE_SIZE):
+    done = object()
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize) for _ in range(len(stages) + 1)]
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def feed():
+        try:
+            for item in source:
+                if stop.is_set():
+                    return
+                put(queues[0], item)
+        except Exception as e:
+            put(queues[0], e)
+        put(queues[0], done)
+
+    def work(stage, inbox, outbox):
+        while not stop.is_set():
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is done:
+                put(outbox, done)
+                return
+            if not isinstance(item, Exception):
+                try:
+                    item = stage(item)
+                except Exception as e:
+                    item = e
+            if item is not None:
+                put(outbox, item)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for idx, stage in enumerate(stages):
+        threads.append(threading.Thread(target=work, args=(stage, queues[idx], queues[idx + 1]), daemon=True))
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            item = queues[-1].get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+def find_matches(title, author, source, api_key=None):
+    matches = []
+    if source == "Open Library":
+        matches = search_open_library(title, author)
+        if not matches:
+            print(f"No valid metadata from Open Library for {title}, trying Google Books")
+            matches.extend(search_google_books(title, author, api_key))
+    elif source == "Google Books":
+        matches = search_google_books(title, author, api_key)
+        if not matches:
+            print(f"No valid metadata from Google Books for {title}, trying Open Library")
+            matches.extend(search_open_library(title, author))
+    return matches
+
+def find_file_matches(file_path, source, api_key=None):
+    title, author = extract_title_and_author_from_filename(os.path.basename(file_path))
+    return find_matches(title, author, source, api_key)
+
+def scan_library(input_dir, extensions, source, api_key=None, progress=None):
+    def lookup(record):
+        if not record.is_missing_metadata():
+            return record.path, None
+        return record.path, find_file_matches(record.path, source, api_key)
+
+    metadata_matches = SpillDict()
+    processed = 0
+    for file_path, matches in run_pipeline(iter_audio_files(input_dir, extensions), read_track_record, lookup):
+        processed += 1
+        if matches is not None:
+            metadata_matches[file_path] = matches
+        if progress and processed % 100 == 0:
+            progress(f"Processed {processed} files")
+    if progress:
+        progress(f"Processed {processed} files")
+    return metadata_matches
+
+def plan_library(input_dir, extensions, pattern, output_dir):
+    def plan_move(record):
+        return record.path, generate_new_path(record.path, pattern, output_dir, record.as_dict())
+
+    return run_pipeline(iter_audio_files(input_dir, extensions), read_track_record, plan_move)
+
+def move_file(old_path, new_path):
+    base, ext = os.path.splitext(new_path)
+    counter = 1
+    while os.path.exists(new_path):
+        new_path = f"{base} ({counter}){ext}"
+        counter += 1
+    os.makedirs(os.path.dirname(new_path), exist_ok=True)
+    shutil.move(old_path, new_path)
+    return new_path
+
 def generate_new_path(file_path, pattern, output_dir, metadata):
     sanitized_metadata = {k: sanitize_filename(v) for k, v in metadata.items()}
     try:
@@ -77,16 +572,10 @@ def extract_title_and_author_from_filename(filename):
 
 def search_open_library(title, author=''):
     try:
-        query = f'title:"{title}"'
-        if author:
-            query += f'+author:"{author}"'
-        url = f"https://openlibrary.org/search.json?q={query.replace(' ', '+')}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        print(f"Open Library API Response for {title}: {data.get('docs', [])[:5]}")
+        data = http_get(OPEN_LIBRARY_SEARCH_URL, build_open_library_query(title, author))
+        print(f"Open Library API Response for {title}: {data.get('docs', [])[:MAX_SEARCH_RESULTS]}")
         matches = []
-        for doc in data.get('docs', [])[:5]:
+        for doc in data.get('docs', [])[:MAX_SEARCH_RESULTS]:
             title = doc.get('title')
             if not title or title == 'Unknown':
                 print(f"Skipping match for {title}: Missing or invalid title")
@@ -96,14 +585,12 @@ def search_open_library(title, author=''):
                 print(f"Skipping match for {title}: Missing or invalid authors")
                 continue
             olid = doc.get('key').split('/')[-1]
-            work_data = get_open_library_metadata(olid)
-            if not work_data:
-                print(f"Skipping match for {title}: Missing or invalid metadata")
-                continue
-            author_str = ', '.join([author.strip() for author in authors if author.strip() and author != 'Unknown'])
+            valid_authors = [author.strip() for author in authors if author.strip() and author != 'Unknown']
+            author_str = ', '.join(valid_authors)
             year = doc.get('first_publish_year')
             display_text = f"{title} by {author_str}" + (f" ({year})" if year else "")
-            matches.append((display_text, {'source': 'Open Library', 'olid': olid}))
+            matches.append((display_text, {'source': 'Open Library', 'olid': olid,
+                                           'metadata': open_library_doc_metadata(doc, valid_authors)}))
         return matches
     except Exception as e:
         print(f"Error searching Open Library: {e}")
@@ -111,21 +598,10 @@ def search_open_library(title, author=''):
 
 def search_open_library_manual(title, author, series):
     try:
-        query_parts = []
-        if title:
-            query_parts.append(f'title:"{title}"')
-        if author:
-            query_parts.append(f'author:"{author}"')
-        if series:
-            query_parts.append(f'series:"{series}"')
-        query = ' '.join(query_parts)
-        url = f"https://openlibrary.org/search.json?q={query.replace(' ', '+')}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        print(f"Open Library Manual Search Response: {data.get('docs', [])[:5]}")
+        data = http_get(OPEN_LIBRARY_SEARCH_URL, build_open_library_query(title, author, series))
+        print(f"Open Library Manual Search Response: {data.get('docs', [])[:MAX_SEARCH_RESULTS]}")
         matches = []
-        for doc in data.get('docs', [])[:5]:
+        for doc in data.get('docs', [])[:MAX_SEARCH_RESULTS]:
             book_title = doc.get('title')
             if not book_title or book_title == 'Unknown':
                 continue
@@ -133,13 +609,12 @@ def search_open_library_manual(title, author, series):
             if not authors or not any(a and a != 'Unknown' for a in authors):
                 continue
             olid = doc.get('key').split('/')[-1]
-            work_data = get_open_library_metadata(olid)
-            if not work_data:
-                continue
-            author_str = ', '.join([a for a in authors if a and a != 'Unknown'])
+            valid_authors = [a for a in authors if a and a != 'Unknown']
+            author_str = ', '.join(valid_authors)
             year = doc.get('first_publish_year')
             display_text = f"{book_title} by {author_str}" + (f" ({year})" if year else "")
-            matches.append((display_text, {'source': 'Open Library', 'olid': olid}))
+            matches.append((display_text, {'source': 'Open Library', 'olid': olid,
+                                           'metadata': open_library_doc_metadata(doc, valid_authors)}))
         return matches
     except requests.exceptions.RequestException as e:
         print(f"Error in manual Open Library search: {e}")
@@ -147,18 +622,11 @@ def search_open_library_manual(title, author, series):
 
 def search_google_books(title, author='', api_key=None):
     try:
-        search_query = f'intitle:"{title}"'
-        if author:
-            search_query += f'+inauthor:"{author}"'
-        url = f"https://www.googleapis.com/books/v1/volumes?q={search_query}"
-        if api_key:
-            url += f"&key={api_key}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        print(f"Google Books API Response for {search_query}: {data.get('items', [])[:5]}")
+        params = build_google_books_query(title, author, api_key)
+        data = http_get(GOOGLE_BOOKS_VOLUMES_URL, params)
+        print(f"Google Books API Response for {params['q']}: {data.get('items', [])[:MAX_SEARCH_RESULTS]}")
         matches = []
-        for item in data.get('items', [])[:5]:
+        for item in data.get('items', [])[:MAX_SEARCH_RESULTS]:
             volumeInfo = item.get('volumeInfo', {})
             title = volumeInfo.get('title')
             if not title or title == 'Unknown':
@@ -177,6 +645,7 @@ def search_google_books(title, author='', api_key=None):
                 'authors': [author.strip() for author in authors if author.strip() and author != 'Unknown'],
                 'publishedDate': publishedDate,
                 'series': title,
+                'cover_url': google_books_cover_url(volumeInfo),
                 'source': 'Google Books'
             }
             matches.append((display_text, {'source': 'Google Books', 'metadata': metadata_dict}))
@@ -187,21 +656,10 @@ def search_google_books(title, author='', api_key=None):
 
 def search_google_books_manual(title, author, api_key=None):
     try:
-        query_parts = []
-        if title:
-            query_parts.append(f'intitle:"{title}"')
-        if author:
-            query_parts.append(f'inauthor:"{author}"')
-        query = '+'.join(query_parts)
-        url = f"https://www.googleapis.com/books/v1/volumes?q={query}"
-        if api_key:
-            url += f"&key={api_key}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        print(f"Google Books Manual Search Response: {data.get('items', [])[:5]}")
+        data = http_get(GOOGLE_BOOKS_VOLUMES_URL, build_google_books_query(title, author, api_key))
+        print(f"Google Books Manual Search Response: {data.get('items', [])[:MAX_SEARCH_RESULTS]}")
         matches = []
-        for item in data.get('items', [])[:5]:
+        for item in data.get('items', [])[:MAX_SEARCH_RESULTS]:
             volumeInfo = item.get('volumeInfo', {})
             book_title = volumeInfo.get('title')
             if not book_title or book_title == 'Unknown':
@@ -218,6 +676,7 @@ def search_google_books_manual(title, author, api_key=None):
                 'authors': [a for a in authors if a and a != 'Unknown'],
                 'publishedDate': publishedDate,
                 'series': book_title,
+                'cover_url': google_books_cover_url(volumeInfo),
                 'source': 'Google Books'
             }
             matches.append((display_text, {'source': 'Google Books', 'metadata': metadata_dict}))
@@ -226,12 +685,29 @@ def search_google_books_manual(title, author, api_key=None):
         print(f"Error in manual Google Books search: {e}")
         return []
 
+def manual_search_key(source, inputs):
+    series = inputs['series'] if source == "Open Library" else ''
+    return (source, inputs['title'].lower(), inputs['author'].lower(), series.lower())
+
+def run_manual_search(source, inputs, api_key):
+    key = manual_search_key(source, inputs)
+    cached = search_cache.get(key)
+    if cached is not None:
+        return cached
+    if source == "Open Library":
+        matches = search_open_library_manual(inputs['title'], inputs['author'], inputs['series'])
+    else:
+        matches = search_google_books_manual(inputs['title'], inputs['author'], api_key)
+    if matches:
+        search_cache.put(key, matches)
+    return matches
+
 def get_open_library_metadata(olid):
+    cached = work_cache.get(olid)
+    if cached is not None:
+        return cached
     try:
-        url = f"https://openlibrary.org/works/{olid}.json"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        data = http_get(f"https://openlibrary.org/works/{olid}.json")
         print(f"Open Library API Response for OLID {olid}: {data}")
         title = data.get('title')
         if not title or title == 'Unknown':
@@ -245,24 +721,28 @@ def get_open_library_metadata(olid):
         if not authors:
             print(f"No valid authors found for OLID {olid}")
             return None
-        publishedDate = data.get('first_publish_date', 'Unknown')
         series = data.get('series')
         series_name = series[0].get('name') if series else ''
-        return {
-            'title': title,
-            'authors': authors,
-            'publishedDate': publishedDate,
-            'series': series_name,
-            'source': 'Open Library'
-        }
+        covers = [cover_id for cover_id in data.get('covers', []) if cover_id and cover_id > 0]
+        book_metadata = open_library_book_metadata(title, authors, data.get('first_publish_date'), series_name,
+                                                   covers[0] if covers else None)
+        work_cache.put(olid, book_metadata)
+        return book_metadata
     except Exception as e:
         print(f"Error fetching metadata for OLID {olid}: {e}")
         return None
 
-def update_metadata(file_path, book_metadata, set_title):
+def resolve_book_metadata(data_dict):
+    if data_dict.get('metadata'):
+        return data_dict['metadata']
+    if data_dict['source'] == 'Open Library':
+        return get_open_library_metadata(data_dict['olid'])
+    return None
+
+def update_metadata(file_path, book_metadata, set_title, cover=None):
     ext = os.path.splitext(file_path)[1].lower()
     try:
-        print(f"Attempting to update metadata for {file_path}: Authors = {book_metadata['authors']}, Series = {book_metadata.get('series', book_metadata['title'])}, Title = {book_metadata['title']}")
+        print(f"Attempting to update metadata for {file_path}: Authors = {book_metadata['authors']}, Series = {book_metadata.get('series') or book_metadata['title']}, Title = {book_metadata['title']}")
         if ext == '.mp3':
             audio = EasyID3(file_path)
             if not audio.get('artist') or audio.get('artist')[0] == 'Unknown':
@@ -272,12 +752,14 @@ def update_metadata(file_path, book_metadata, set_title):
                     print(f"No valid author for {file_path}, skipping artist update")
                     return False
             if not audio.get('album') or audio.get('album')[0] == 'Unknown':
-                audio['album'] = [book_metadata.get('series', book_metadata['title'])]
+                audio['album'] = [(book_metadata.get('series') or book_metadata['title'])]
             if set_title and (not audio.get('title') or audio.get('title')[0] == 'Unknown'):
                 audio['title'] = [book_metadata['title']]
             if book_metadata['publishedDate'] and book_metadata['publishedDate'] != 'Unknown':
                 if not audio.get('date') or audio.get('date')[0] == 'Unknown':
                     audio['date'] = [book_metadata['publishedDate']]
+            if cover and image_mime(cover) and not audio.get('coverart'):
+                audio['coverart'] = [cover]
             audio.save()
         elif ext in ['.m4a', '.m4b']:
             audio = MP4(file_path)
@@ -288,12 +770,15 @@ def update_metadata(file_path, book_metadata, set_title):
                     print(f"No valid author for {file_path}, skipping artist update")
                     return False
             if '\xa9alb' not in audio or not audio['\xa9alb'] or audio['\xa9alb'][0] == 'Unknown':
-                audio['\xa9alb'] = [book_metadata.get('series', book_metadata['title'])]
+                audio['\xa9alb'] = [(book_metadata.get('series') or book_metadata['title'])]
             if set_title and ('\xa9nam' not in audio or not audio['\xa9nam'] or audio['\xa9nam'][0] == 'Unknown'):
                 audio['\xa9nam'] = [book_metadata['title']]
             if book_metadata['publishedDate'] and book_metadata['publishedDate'] != 'Unknown':
                 if '\xa9day' not in audio or not audio['\xa9day'] or audio['\xa9day'][0] == 'Unknown':
                     audio['\xa9day'] = [book_metadata['publishedDate']]
+            if cover and image_mime(cover) and not audio.get('covr'):
+                imageformat = MP4Cover.FORMAT_PNG if image_mime(cover) == 'image/png' else MP4Cover.FORMAT_JPEG
+                audio['covr'] = [MP4Cover(cover, imageformat=imageformat)]
             audio.save()
         updated_metadata = extract_metadata(file_path)
         print(f"Updated metadata for {file_path}: Artist = {updated_metadata['artist']}, Album = {updated_metadata['album']}, Title = {updated_metadata['title']}")
@@ -305,11 +790,61 @@ def update_metadata(file_path, book_metadata, set_title):
         print(f"Error updating metadata for {file_path}: {e}")
         return False
 
+class ManualSearchWorker(QObject):
+    results_signal = Signal(int, list)
+    error_signal = Signal(int, str)
+
+    def __init__(self):
+        super().__init__()
+        self.latest_request_id = 0
+        self.pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+        self.pending = None
+
+    def next_request_id(self):
+        self.latest_request_id += 1
+        return self.latest_request_id
+
+    def is_stale(self, request_id):
+        return request_id != self.latest_request_id
+
+    def shutdown(self):
+        self.next_request_id()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    @Slot(int, str, dict, str)
+    def search(self, request_id, source, inputs, api_key):
+        if self.is_stale(request_id):
+            return
+        if self.pending is not None:
+            self.pending.cancel()
+        try:
+            self.pending = self.pool.submit(self.run_search, request_id, source, inputs, api_key)
+        except RuntimeError:
+            pass
+
+    def run_search(self, request_id, source, inputs, api_key):
+        if self.is_stale(request_id):
+            return
+        try:
+            matches = run_manual_search(source, inputs, api_key)
+        except Exception as e:
+            print(f"Manual search error: {e}")
+            self.error_signal.emit(request_id, str(e))
+            return
+        if not self.is_stale(request_id):
+            self.results_signal.emit(request_id, matches)
+
 class ManualSearchDialog(QDialog):
-    def __init__(self, source, parent=None):
+    search_requested = Signal(int, str, dict, str)
+
+    def __init__(self, source, api_key, search_worker, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Manual Metadata Search")
         self.source = source
+        self.api_key = api_key
+        self.search_worker = search_worker
+        self.request_id = None
+        self.matches = []
         layout = QFormLayout(self)
         self.title_input = QLineEdit(self)
         self.author_input = QLineEdit(self)
@@ -320,16 +855,90 @@ class ManualSearchDialog(QDialog):
         if source == "Google Books":
             self.series_input.setEnabled(False)
             self.series_input.setPlaceholderText("Not supported by Google Books")
+        self.live_search_checkbox = QCheckBox("Search as you type", self)
+        self.search_button = QPushButton("Search", self)
+        self.search_button.clicked.connect(self.start_search)
+        search_row = QHBoxLayout()
+        search_row.addWidget(self.live_search_checkbox)
+        search_row.addWidget(self.search_button)
+        layout.addRow(search_row)
+        self.results_list = QListWidget(self)
+        self.results_list.itemDoubleClicked.connect(self.accept)
+        self.status_label = QLabel("", self)
+        layout.addRow("Results:", self.results_list)
+        layout.addRow(self.status_label)
         buttons = QHBoxLayout()
-        ok_button = QPushButton("OK", self)
+        self.ok_button = QPushButton("OK", self)
+        self.ok_button.setEnabled(False)
         cancel_button = QPushButton("Cancel", self)
-        ok_button.clicked.connect(self.accept)
+        self.ok_button.clicked.connect(self.accept)
         cancel_button.clicked.connect(self.reject)
-        buttons.addWidget(ok_button)
+        buttons.addWidget(self.ok_button)
         buttons.addWidget(cancel_button)
         layout.addRow(buttons)
         self.setLayout(layout)
 
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.start_search)
+        for field in (self.title_input, self.author_input, self.series_input):
+            field.textChanged.connect(self.schedule_search)
+        self.search_requested.connect(self.search_worker.search)
+        self.search_worker.results_signal.connect(self.show_results)
+        self.search_worker.error_signal.connect(self.show_error)
+
+    def schedule_search(self):
+        if self.live_search_checkbox.isChecked():
+            self.debounce_timer.start()
+
+    def start_search(self):
+        self.debounce_timer.stop()
+        inputs = self.get_inputs()
+        if not any(inputs.values()):
+            self.status_label.setText("Please enter at least one search term")
+            return
+        self.request_id = self.search_worker.next_request_id()
+        cached = search_cache.get(manual_search_key(self.source, inputs))
+        if cached is not None:
+            self.show_results(self.request_id, cached)
+            return
+        self.status_label.setText("Searching...")
+        self.search_requested.emit(self.request_id, self.source, inputs, self.api_key)
+
+    def show_results(self, request_id, matches):
+        if request_id != self.request_id:
+            return
+        self.matches = matches
+        self.results_list.clear()
+        for display_text, _ in matches:
+            self.results_list.addItem(display_text)
+        if matches:
+            self.results_list.setCurrentRow(0)
+            self.status_label.setText(f"Found {len(matches)} matches")
+        else:
+            self.status_label.setText("No matches found. Check your search terms or network connection.")
+        self.ok_button.setEnabled(bool(matches))
+
+    def show_error(self, request_id, message):
+        if request_id != self.request_id:
+            return
+        self.status_label.setText(f"Search failed: {message}. Please check your internet connection or API key.")
+
+    def selected_matches(self):
+        row = self.results_list.currentRow()
+        if row <= 0:
+            return list(self.matches)
+        return [self.matches[row]] + self.matches[:row] + self.matches[row + 1:]
+
+    def done(self, result):
+        self.debounce_timer.stop()
+        self.search_worker.next_request_id()
+        self.search_requested.disconnect(self.search_worker.search)
+        self.search_worker.results_signal.disconnect(self.show_results)
+        self.search_worker.error_signal.disconnect(self.show_error)
+        super().done(result)
+
     def get_inputs(self):
         return {
             'title': self.title_input.text().strip(),
@@ -339,7 +948,7 @@ class ManualSearchDialog(QDialog):
 
 class MetadataWorker(QObject):
     progress_signal = Signal(str)
-    results_signal = Signal(dict)
+    results_signal = Signal(object)
 
     def __init__(self):
         super().__init__()
@@ -357,38 +966,160 @@ class MetadataWorker(QObject):
     def process_files(self):
         if not self.input_dir or not self.selected_extensions:
             return
-        all_files = []
-        for root, _, filenames in os.walk(self.input_dir):
-            for filename in filenames:
-                if os.path.splitext(filename)[1].lower() in self.selected_extensions:
-                    all_files.append(os.path.join(root, filename))
-        total_files = len(all_files)
-        metadata_matches = {}
-        for idx, file_path in enumerate(all_files):
-            metadata = extract_metadata(file_path)
-            if metadata['artist'] == 'Unknown' or metadata['title'] == 'Unknown' or metadata['album'] == 'Unknown':
-                title, author = extract_title_and_author_from_filename(os.path.basename(file_path))
-                matches = []
-                if self.source == "Open Library":
-                    matches = search_open_library(title, author)
-                    if not matches:
-                        print(f"No valid metadata from Open Library for {title}, trying Google Books")
-                        matches.extend(search_google_books(title, author, self.api_key))
-                elif self.source == "Google Books":
-                    matches = search_google_books(title, author, self.api_key)
-                    if not matches:
-                        print(f"No valid metadata from Google Books for {title}, trying Open Library")
-                        matches.extend(search_open_library(title, author))
-                metadata_matches[file_path] = matches
-            self.progress_signal.emit(f"Processed {idx+1}/{total_files} files")
+        metadata_matches = scan_library(self.input_dir, self.selected_extensions, self.source, self.api_key,
+                                        self.progress_signal.emit)
         self.results_signal.emit(metadata_matches)
 
+class PrefetchWorker(QObject):
+    def __init__(self):
+        super().__init__()
+        self.queue = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.generation = 0
+        self.running = True
+        self.fetch_covers = True
+        self.pool = ThreadPoolExecutor(max_workers=COVER_WORKERS)
+        self.slots = threading.Semaphore(COVER_WORKERS)
+
+    def prefetch_focus(self, focus_payloads, window_payloads):
+        self.generation += 1
+        for distance, payloads in enumerate(focus_payloads + window_payloads):
+            for idx, data_dict in enumerate(payloads):
+                warm_cover = distance < len(focus_payloads) and idx == 0
+                if warm_cover or not data_dict.get('metadata'):
+                    self.queue.put(((distance, idx), next(self.counter), self.generation, data_dict, warm_cover))
+
+    def stop(self):
+        self.running = False
+        self.queue.put(((-1, 0), next(self.counter), None, None, False))
+        self.slots.release()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def run(self):
+        while self.running:
+            _, _, generation, data_dict, warm_cover = self.queue.get()
+            if data_dict is None:
+                continue
+            if generation != self.generation:
+                continue
+            self.slots.acquire()
+            if not self.running or generation != self.generation:
+                self.slots.release()
+                continue
+            try:
+                self.pool.submit(self.warm, data_dict, warm_cover)
+            except RuntimeError:
+                self.slots.release()
+
+    def warm(self, data_dict, warm_cover):
+        try:
+            book_metadata = resolve_book_metadata(data_dict)
+            if warm_cover and self.fetch_covers and book_metadata:
+                url = cover_url(book_metadata)
+                if url and url not in cover_cache:
+                    cover_cache.get(url)
+        except Exception as e:
+            print(f"Error prefetching metadata: {e}")
+        finally:
+            self.slots.release()
+
+class TagWriteWorker(QObject):
+    progress_signal = Signal(str)
+    finished_signal = Signal(list, list)
+
+    def __init__(self):
+        super().__init__()
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+    @Slot(list, bool, bool)
+    def write(self, jobs, set_title, embed_cover):
+        if not self.running:
+            return
+        resolved = []
+        for file_path, data_dict in jobs:
+            book_metadata = resolve_book_metadata(data_dict)
+            if book_metadata:
+                resolved.append((file_path, book_metadata))
+            else:
+                self.progress_signal.emit(f"Failed to fetch book metadata for {os.path.basename(file_path)}")
+        covers = fetch_covers([book_metadata for _, book_metadata in resolved]) if embed_cover else {}
+        updated = []
+        failed = []
+        for file_path, book_metadata in resolved:
+            if update_metadata(file_path, book_metadata, set_title, covers.get(cover_url(book_metadata))):
+                updated.append(file_path)
+            else:
+                failed.append(file_path)
+        self.finished_signal.emit(updated, failed)
+
+class ReviewListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.matches = SpillDict()
+        self._count = 0
+        self._block_start = 0
+        self._block = []
+
+    def set_matches(self, matches):
+        self.beginResetModel()
+        self.matches.close()
+        self.matches = matches
+        self._count = len(matches)
+        self._block = []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return os.path.basename(self.file_path(index.row()))
+        if role == Qt.UserRole:
+            return self.file_path(index.row())
+        return None
+
+    def file_path(self, row):
+        if not self._block_start <= row < self._block_start + len(self._block):
+            self._block_start = max(0, row - REVIEW_BLOCK_SIZE // 2)
+            self._block = self.matches.keys_slice(self._block_start, REVIEW_BLOCK_SIZE)
+        return self._block[row - self._block_start]
+
+    def remove_row(self, row):
+        file_path = self.file_path(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.matches[file_path]
+        self._count -= 1
+        self._block = []
+        self.endRemoveRows()
+
+    def remove_files(self, file_paths):
+        if not file_paths:
+            return
+        self.beginResetModel()
+        for file_path in file_paths:
+            if file_path in self.matches:
+                del self.matches[file_path]
+        self._count = len(self.matches)
+        self._block = []
+        self.endResetModel()
+
+    def close(self):
+        self.matches.close()
+
 class AudiobookOrganizer(QMainWindow):
+    tag_write_requested = Signal(list, bool, bool)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Audiobook File Organizer")
         self.setGeometry(100, 100, 800, 600)
-        self.metadata_matches = {}
+        self.review_model = ReviewListModel(self)
+        self.preview_plan = SpillDict()
 
         self.input_dir_label = QLabel("Input Directory:")
         self.input_dir_text = QLineEdit()
@@ -416,7 +1147,7 @@ class AudiobookOrganizer(QMainWindow):
         self.file_types_group.setLayout(self.file_types_layout)
 
         self.pattern_label = QLabel("Path Pattern (e.g., {artist}/{album}/{title}/{title}.{ext}):")
-        self.pattern_text = QLineEdit("{artist}/{album}/{title}/{title}.{ext}")
+        self.pattern_text = QLineEdit(DEFAULT_PATTERN)
         self.placeholders_label = QLabel("Available placeholders: {artist}, {title}, {album}, {tracknumber}, {year}, {genre}, {ext}")
 
         self.metadata_group = QGroupBox("Metadata Matching")
@@ -435,10 +1166,14 @@ class AudiobookOrganizer(QMainWindow):
         self.metadata_layout.addLayout(source_layout)
         
         self.missing_metadata_label = QLabel("Files with Missing Metadata:")
-        self.missing_metadata_list = QListWidget()
-        self.missing_metadata_list.itemSelectionChanged.connect(self.update_match_combo)
+        self.missing_metadata_list = QListView()
+        self.missing_metadata_list.setUniformItemSizes(True)
+        self.missing_metadata_list.setModel(self.review_model)
+        self.missing_metadata_list.selectionModel().selectionChanged.connect(lambda *_: self.update_match_combo())
         self.match_combo = QComboBox()
         self.set_title_checkbox = QCheckBox("Set title to book title")
+        self.embed_cover_checkbox = QCheckBox("Embed cover art")
+        self.embed_cover_checkbox.setChecked(True)
         self.apply_button = QPushButton("Apply")
         self.apply_button.clicked.connect(self.apply_match)
         self.skip_button = QPushButton("Skip")
@@ -462,6 +1197,7 @@ class AudiobookOrganizer(QMainWindow):
         self.metadata_layout.addWidget(self.missing_metadata_label)
         self.metadata_layout.addWidget(self.missing_metadata_list)
         self.metadata_layout.addWidget(self.set_title_checkbox)
+        self.metadata_layout.addWidget(self.embed_cover_checkbox)
         self.metadata_layout.addLayout(match_controls)
         self.metadata_layout.addLayout(navigation)
         self.metadata_layout.addWidget(self.match_all_button)
@@ -510,6 +1246,81 @@ class AudiobookOrganizer(QMainWindow):
         self.setCentralWidget(central_widget)
         self.setStatusBar(self.status_bar)
 
+        self.prefetch_worker = PrefetchWorker()
+        self.prefetch_thread = QThread()
+        self.prefetch_worker.moveToThread(self.prefetch_thread)
+        self.embed_cover_checkbox.toggled.connect(self.set_prefetch_covers)
+        self.prefetch_thread.started.connect(self.prefetch_worker.run)
+        self.prefetch_thread.start()
+
+        self.search_worker = ManualSearchWorker()
+        self.search_thread = QThread()
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_thread.start()
+
+        self.tag_write_row = None
+        self.tag_write_busy = False
+        self.match_all_running = False
+        self.match_all_last_key = None
+        self.match_all_updated = 0
+        self.tag_worker = TagWriteWorker()
+        self.tag_thread = QThread()
+        self.tag_worker.moveToThread(self.tag_thread)
+        self.tag_write_requested.connect(self.tag_worker.write)
+        self.tag_worker.progress_signal.connect(self.update_status_bar)
+        self.tag_worker.finished_signal.connect(self.tag_write_finished)
+        self.tag_thread.start()
+
+    def closeEvent(self, event):
+        self.prefetch_worker.stop()
+        self.prefetch_thread.quit()
+        self.prefetch_thread.wait()
+        self.tag_worker.stop()
+        self.tag_thread.quit()
+        self.tag_thread.wait()
+        self.search_worker.shutdown()
+        self.search_thread.quit()
+        self.search_thread.wait()
+        self.review_model.close()
+        self.preview_plan.close()
+        super().closeEvent(event)
+
+    def set_prefetch_covers(self, checked):
+        self.prefetch_worker.fetch_covers = checked
+
+    def current_row(self):
+        return self.missing_metadata_list.currentIndex().row()
+
+    def set_current_row(self, row):
+        self.missing_metadata_list.setCurrentIndex(self.review_model.index(row))
+
+    def selected_file_path(self):
+        indexes = self.missing_metadata_list.selectionModel().selectedIndexes()
+        return indexes[0].data(Qt.UserRole) if indexes else None
+
+    def remove_review_row(self, row):
+        self.review_model.remove_row(row)
+        if self.review_model.rowCount() > 0:
+            self.set_current_row(min(row, self.review_model.rowCount() - 1))
+
+    def candidate_payloads(self, file_path):
+        return [data_dict for _, data_dict in self.review_model.matches.get(file_path, [])]
+
+    def schedule_prefetch(self):
+        row = self.current_row()
+        if row == -1:
+            return
+        focus_rows = [row]
+        for distance in range(1, PREFETCH_NEIGHBORS + 1):
+            focus_rows.extend([row + distance, row - distance])
+        window_rows = range(row + PREFETCH_NEIGHBORS + 1, row + PREFETCH_WINDOW + 1)
+        self.prefetch_worker.prefetch_focus(self.candidate_payloads_for(focus_rows),
+                                            self.candidate_payloads_for(window_rows))
+
+    def candidate_payloads_for(self, rows):
+        return [self.candidate_payloads(self.review_model.file_path(r))
+                for r in rows if 0 <= r < self.review_model.rowCount()]
+
     def select_input_directory(self):
         dir_path = QFileDialog.getExistingDirectory(self, "Select Input Directory")
         if dir_path:
@@ -547,14 +1358,10 @@ class AudiobookOrganizer(QMainWindow):
         self.status_bar.showMessage(message)
 
     def populate_metadata_list(self, metadata_matches):
-        self.missing_metadata_list.clear()
-        self.metadata_matches = metadata_matches
-        for file_path in metadata_matches.keys():
-            item = QListWidgetItem(os.path.basename(file_path))
-            item.setData(Qt.UserRole, file_path)
-            self.missing_metadata_list.addItem(item)
-        if metadata_matches:
-            self.status_bar.showMessage(f"Found {len(metadata_matches)} files with missing metadata")
+        self.review_model.set_matches(metadata_matches)
+        self.update_match_combo()
+        if self.review_model.rowCount() > 0:
+            self.status_bar.showMessage(f"Found {self.review_model.rowCount()} files with missing metadata")
         else:
             self.status_bar.showMessage("No files with missing metadata found")
         self.metadata_thread.quit()
@@ -562,124 +1369,123 @@ class AudiobookOrganizer(QMainWindow):
 
     def update_match_combo(self):
         self.match_combo.clear()
-        selected_items = self.missing_metadata_list.selectedItems()
-        if selected_items:
-            file_path = selected_items[0].data(Qt.UserRole)
-            matches = self.metadata_matches.get(file_path, [])
+        file_path = self.selected_file_path()
+        if file_path:
+            matches = self.review_model.matches.get(file_path, [])
             self.match_combo.addItem("No match", None)
             for display_text, data_dict in matches:
                 self.match_combo.addItem(display_text, data_dict)
-            self.apply_button.setEnabled(self.match_combo.count() > 1)
+            self.apply_button.setEnabled(not self.tag_write_busy and self.match_combo.count() > 1)
+            self.schedule_prefetch()
         else:
             self.apply_button.setEnabled(False)
 
     def perform_manual_search(self):
-        selected_items = self.missing_metadata_list.selectedItems()
-        if not selected_items:
+        file_path = self.selected_file_path()
+        if not file_path:
             QMessageBox.warning(self, "Warning", "Please select a file to perform a manual search")
             return
-        file_path = selected_items[0].data(Qt.UserRole)
-        dialog = ManualSearchDialog(self.metadata_source_combo.currentText(), self)
-        if dialog.exec():
-            inputs = dialog.get_inputs()
-            if not any(inputs.values()):
-                QMessageBox.warning(self, "Warning", "Please enter at least one search term")
-                return
-            source = self.metadata_source_combo.currentText()
-            api_key = self.google_api_key_text.text()
-            if source == "Google Books" and not api_key:
-                QMessageBox.warning(self, "Warning", "Please enter a valid Google Books API key")
-                return
-            try:
-                matches = []
-                if source == "Open Library":
-                    matches = search_open_library_manual(inputs['title'], inputs['author'], inputs['series'])
-                else:
-                    matches = search_google_books_manual(inputs['title'], inputs['author'], api_key)
-                if not matches:
-                    QMessageBox.information(self, "No Results", "No matches found. Check your search terms or network connection.")
-                    return
-                self.metadata_matches[file_path] = matches
-                self.update_match_combo()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Search failed: {str(e)}. Please check your internet connection or API key.")
-                print(f"Manual search error: {e}")
+        source = self.metadata_source_combo.currentText()
+        api_key = self.google_api_key_text.text()
+        if source == "Google Books" and not api_key:
+            QMessageBox.warning(self, "Warning", "Please enter a valid Google Books API key")
+            return
+        dialog = ManualSearchDialog(source, api_key, self.search_worker, self)
+        if dialog.exec() and dialog.matches:
+            self.review_model.matches[file_path] = dialog.selected_matches()
+            self.update_match_combo()
+            self.match_combo.setCurrentIndex(1)
 
     def apply_match(self):
-        selected_items = self.missing_metadata_list.selectedItems()
-        if not selected_items:
+        file_path = self.selected_file_path()
+        if not file_path or self.tag_write_busy:
             return
-        file_path = selected_items[0].data(Qt.UserRole)
         data_dict = self.match_combo.currentData()
         if data_dict:
-            source = data_dict['source']
-            if source == 'Open Library':
-                olid = data_dict['olid']
-                book_metadata = get_open_library_metadata(olid)
-            elif source == 'Google Books':
-                book_metadata = data_dict['metadata']
-            else:
-                book_metadata = None
-            if book_metadata:
-                if update_metadata(file_path, book_metadata, self.set_title_checkbox.isChecked()):
-                    row = self.missing_metadata_list.currentRow()
-                    self.missing_metadata_list.takeItem(row)
-                    del self.metadata_matches[file_path]
-                    self.status_bar.showMessage(f"Updated metadata for {os.path.basename(file_path)}")
-                    if self.missing_metadata_list.count() > 0:
-                        self.missing_metadata_list.setCurrentRow(min(row, self.missing_metadata_list.count() - 1))
-                else:
-                    self.status_bar.showMessage(f"Failed to update metadata for {os.path.basename(file_path)}")
-            else:
-                self.status_bar.showMessage(f"Failed to fetch book metadata for {os.path.basename(file_path)}")
+            self.tag_write_row = self.current_row()
+            self.start_tag_write([(file_path, data_dict)])
         else:
             self.status_bar.showMessage("Please select a match")
 
     def skip_file(self):
-        row = self.missing_metadata_list.currentRow()
+        row = self.current_row()
         if row != -1:
-            file_path = self.missing_metadata_list.item(row).data(Qt.UserRole)
-            self.missing_metadata_list.takeItem(row)
-            del self.metadata_matches[file_path]
+            file_path = self.review_model.file_path(row)
+            self.remove_review_row(row)
             self.status_bar.showMessage(f"Skipped {os.path.basename(file_path)}")
-            if self.missing_metadata_list.count() > 0:
-                self.missing_metadata_list.setCurrentRow(min(row, self.missing_metadata_list.count() - 1))
 
     def next_file(self):
-        current_row = self.missing_metadata_list.currentRow()
-        if current_row != -1 and current_row < self.missing_metadata_list.count() - 1:
-            self.missing_metadata_list.setCurrentRow(current_row + 1)
+        current_row = self.current_row()
+        if current_row != -1 and current_row < self.review_model.rowCount() - 1:
+            self.set_current_row(current_row + 1)
 
     def previous_file(self):
-        current_row = self.missing_metadata_list.currentRow()
+        current_row = self.current_row()
         if current_row > 0:
-            self.missing_metadata_list.setCurrentRow(current_row - 1)
+            self.set_current_row(current_row - 1)
 
     def match_all(self):
-        for row in range(self.missing_metadata_list.count() - 1, -1, -1):
-            item = self.missing_metadata_list.item(row)
-            file_path = item.data(Qt.UserRole)
-            matches = self.metadata_matches.get(file_path, [])
+        if self.tag_write_busy:
+            return
+        file_paths = self.review_model.matches.keys_after(None, COVER_BATCH_SIZE)
+        if not file_paths:
+            self.status_bar.showMessage("All files matched or skipped")
+            return
+        self.tag_write_row = None
+        self.match_all_running = True
+        self.match_all_updated = 0
+        self.send_match_all_batch(file_paths)
+
+    def send_match_all_batch(self, file_paths):
+        jobs = []
+        for file_path in file_paths:
+            matches = self.review_model.matches.get(file_path)
             if matches:
-                display_text, data_dict = matches[0]
-                if data_dict['source'] == 'Open Library':
-                    olid = data_dict['olid']
-                    book_metadata = get_open_library_metadata(olid)
-                elif data_dict['source'] == 'Google Books':
-                    book_metadata = data_dict['metadata']
-                else:
-                    continue
-                if book_metadata:
-                    if update_metadata(file_path, book_metadata, self.set_title_checkbox.isChecked()):
-                        self.missing_metadata_list.takeItem(row)
-                        del self.metadata_matches[file_path]
-                        self.status_bar.showMessage(f"Updated metadata for {os.path.basename(file_path)}")
-                    else:
-                        self.status_bar.showMessage(f"Failed to update metadata for {os.path.basename(file_path)}")
-        if self.missing_metadata_list.count() == 0:
+                jobs.append((file_path, matches[0][1]))
+        self.match_all_last_key = file_paths[-1]
+        self.start_tag_write(jobs)
+
+    def start_tag_write(self, jobs):
+        self.set_tag_write_busy(True)
+        self.tag_write_requested.emit(jobs, self.set_title_checkbox.isChecked(),
+                                      self.embed_cover_checkbox.isChecked())
+
+    def set_tag_write_busy(self, busy):
+        self.tag_write_busy = busy
+        for button in (self.skip_button, self.manual_search_button, self.match_all_button):
+            button.setEnabled(not busy)
+        self.apply_button.setEnabled(not busy and self.match_combo.count() > 1)
+
+    def tag_write_finished(self, updated, failed):
+        if self.match_all_running:
+            self.match_all_batch_finished(updated)
+            return
+        row = self.tag_write_row
+        self.tag_write_row = None
+        self.set_tag_write_busy(False)
+        if updated:
+            if row < self.review_model.rowCount() and self.review_model.file_path(row) == updated[0]:
+                self.remove_review_row(row)
+            self.status_bar.showMessage(f"Updated metadata for {os.path.basename(updated[0])}")
+        elif failed:
+            self.status_bar.showMessage(f"Failed to update metadata for {os.path.basename(failed[0])}")
+
+    def match_all_batch_finished(self, updated):
+        self.match_all_updated += len(updated)
+        next_file_paths = self.review_model.matches.keys_after(self.match_all_last_key, COVER_BATCH_SIZE)
+        self.review_model.remove_files(updated)
+        if next_file_paths:
+            self.status_bar.showMessage(f"Updated metadata for {self.match_all_updated} files")
+            self.send_match_all_batch(next_file_paths)
+            return
+        self.match_all_running = False
+        self.set_tag_write_busy(False)
+        if self.review_model.rowCount() == 0:
             self.status_bar.showMessage("All files matched or skipped")
         else:
-            self.status_bar.showMessage(f"{self.missing_metadata_list.count()} files could not be matched, please review")
+            self.set_current_row(0)
+            self.status_bar.showMessage(f"{self.review_model.rowCount()} files could not be matched, please review")
+        self.update_match_combo()
 
     def preview_changes(self):
         input_dir = self.input_dir_text.text()
@@ -696,50 +1502,43 @@ class AudiobookOrganizer(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please enter a path pattern")
             return
 
-        files = []
-        for root, _, filenames in os.walk(input_dir):
-            for filename in filenames:
-                if os.path.splitext(filename)[1].lower() in selected_extensions:
-                    files.append(os.path.join(root, filename))
-
         self.preview_table.setRowCount(0)
-        for file_path in files:
-            metadata = extract_metadata(file_path)
-            try:
-                new_path = generate_new_path(file_path, pattern, output_dir, metadata)
+        self.preview_plan.close()
+        self.preview_plan = SpillDict()
+        try:
+            for file_path, new_path in plan_library(input_dir, selected_extensions, pattern, output_dir):
+                self.preview_plan[file_path] = new_path
                 row = self.preview_table.rowCount()
-                self.preview_table.insertRow(row)
-                self.preview_table.setItem(row, 0, QTableWidgetItem(file_path))
-                self.preview_table.setItem(row, 1, QTableWidgetItem(new_path))
-            except ValueError as e:
-                self.status_bar.showMessage(str(e))
-                return
+                if row < PREVIEW_ROW_LIMIT:
+                    self.preview_table.insertRow(row)
+                    self.preview_table.setItem(row, 0, QTableWidgetItem(file_path))
+                    self.preview_table.setItem(row, 1, QTableWidgetItem(new_path))
+        except ValueError as e:
+            self.preview_plan.close()
+            self.preview_table.setRowCount(0)
+            self.status_bar.showMessage(str(e))
+            return
         self.preview_table.resizeColumnsToContents()
-        self.status_bar.showMessage("Preview generated")
+        total = len(self.preview_plan)
+        if total > PREVIEW_ROW_LIMIT:
+            self.status_bar.showMessage(f"Preview generated: showing first {PREVIEW_ROW_LIMIT} of {total} files")
+        else:
+            self.status_bar.showMessage("Preview generated")
 
     def execute_changes(self):
         self.preview_changes()
-        if self.preview_table.rowCount() == 0:
+        if len(self.preview_plan) == 0:
             QMessageBox.warning(self, "Warning", "No files to process")
             return
         reply = QMessageBox.question(self, "Confirm", "Are you sure you want to rename and organize the files as shown?",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.No:
             return
-        for row in range(self.preview_table.rowCount()):
-            old_path = self.preview_table.item(row, 0).text()
-            new_path = self.preview_table.item(row, 1).text()
-            base, ext = os.path.splitext(new_path)
-            counter = 1
-            original_new_path = new_path
-            while os.path.exists(new_path):
-                new_path = f"{base} ({counter}){ext}"
-                counter += 1
-            if new_path != original_new_path:
-                self.preview_table.setItem(row, 1, QTableWidgetItem(new_path))
+        for row, (old_path, planned_path) in enumerate(self.preview_plan.items()):
             try:
-                os.makedirs(os.path.dirname(new_path), exist_ok=True)
-                shutil.move(old_path, new_path)
+                new_path = move_file(old_path, planned_path)
+                if new_path != planned_path and row < self.preview_table.rowCount():
+                    self.preview_table.setItem(row, 1, QTableWidgetItem(new_path))
                 self.status_bar.showMessage(f"Moved {os.path.basename(old_path)} to {os.path.basename(new_path)}")
             except Exception as e:
                 self.status_bar.showMessage(f"Error moving {os.path.basename(old_path)}: {e}")
@@ -754,9 +1553,10 @@ class AudiobookOrganizer(QMainWindow):
         4. Choose a metadata source (Open Library or Google Books) and provide an API key for Google Books.
         5. The 'Files with Missing Metadata' list shows files needing metadata.
         6. Select a file, choose a match from the dropdown, or click 'Manual Search' to enter title/author/series.
+           In the search window, click 'Search' or check 'Search as you type' to update results while typing.
         7. Click 'Apply' to update metadata, 'Skip' to ignore, or 'Match All' to auto-match all files.
         8. Use 'Next'/'Previous' to navigate files.
-        9. Check 'Set title to book title' to update titles to book titles.
+        9. Check 'Set title to book title' to update titles to book titles, and 'Embed cover art' to add the book cover.
         10. Enter a path pattern (e.g., {artist}/{album}/{title}/{title}.{ext}).
         11. Click 'Preview' to review renaming/organizing changes.
         12. Click 'Rename and Organize' to apply changes.
@@ -770,8 +1570,342 @@ class AudiobookOrganizer(QMainWindow):
         """
         QMessageBox.information(self, "Help", help_text)
 
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def paths_overlap(first, second):
+    return os.path.commonpath([first, second]) in (first, second)
+
+class Job:
+    def __init__(self, job_id, kind, root, claims, output_dir=None, source_job=None):
+        self.id = job_id
+        self.kind = kind
+        self.root = root
+        self.claims = claims
+        self.output_dir = output_dir
+        self.source_job = source_job
+        self.status = 'running'
+        self.progress = ''
+        self.error = None
+        self.result = None
+        self.changed = asyncio.Event()
+
+    def publish(self, progress=None):
+        if progress is not None:
+            self.progress = progress
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'root': self.root,
+            'output_dir': self.output_dir,
+            'status': self.status,
+            'progress': self.progress,
+            'error': self.error,
+            'count': len(self.result) if self.result is not None else 0
+        }
+
+class OrganizerService:
+    def __init__(self, workers=SERVICE_WORKERS, token=None):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.token = token
+        self.jobs = {}
+        self.tasks = set()
+        self.applying = set()
+        self.job_ids = itertools.count(1)
+        self.loop = None
+
+    async def serve(self, host, port):
+        self.loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"Audiobook Organizer service listening on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            if len(request_line) < 2:
+                return
+            method, path = request_line[0], request_line[1].split('?')[0]
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            try:
+                self.check_token(headers)
+                body = await reader.readexactly(self.content_length(headers))
+                payload = json.loads(body) if body else {}
+                if not isinstance(payload, dict):
+                    raise ServiceError(400, "Request body must be a JSON object")
+                await self.route(method, path, payload, writer)
+            except ServiceError as e:
+                await self.send_json(writer, e.status, {'error': str(e)})
+            except (ValueError, KeyError, TypeError) as e:
+                await self.send_json(writer, 400, {'error': str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def check_token(self, headers):
+        if self.token is None:
+            return
+        scheme, _, token = headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not hmac.compare_digest(token.encode(), self.token.encode()):
+            raise ServiceError(401, "Missing or invalid bearer token")
+
+    def content_length(self, headers):
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ServiceError(400, "Invalid Content-Length")
+        if length < 0:
+            raise ServiceError(400, "Invalid Content-Length")
+        if length > SERVICE_MAX_BODY:
+            raise ServiceError(413, f"Request body larger than {SERVICE_MAX_BODY} bytes")
+        return length
+
+    async def route(self, method, path, payload, writer):
+        parts = [part for part in path.split('/') if part]
+        if method == 'GET' and parts == ['jobs']:
+            await self.send_json(writer, 200, [job.to_dict() for job in self.jobs.values()])
+        elif method == 'POST' and parts == ['jobs', 'scan']:
+            await self.send_json(writer, 202, self.start_scan(payload).to_dict())
+        elif method == 'POST' and parts == ['jobs', 'plan']:
+            await self.send_json(writer, 202, self.start_plan(payload).to_dict())
+        elif method == 'POST' and parts == ['jobs', 'execute']:
+            await self.send_json(writer, 202, self.start_execute(payload).to_dict())
+        elif len(parts) >= 2 and parts[0] == 'jobs':
+            job = self.get_job(parts[1])
+            if method == 'GET' and len(parts) == 2:
+                await self.send_json(writer, 200, job.to_dict())
+            elif method == 'GET' and parts[2:] == ['events']:
+                await self.stream_events(writer, job)
+            elif method == 'GET' and parts[2:] == ['result']:
+                await self.stream_result(writer, job)
+            elif method == 'DELETE' and len(parts) == 2:
+                self.delete_job(job)
+                await self.send_json(writer, 200, {'deleted': job.id})
+            else:
+                raise ServiceError(404, f"Unknown endpoint {method} {path}")
+        elif method == 'POST' and parts == ['candidates']:
+            await self.send_json(writer, 200, {'matches': await self.candidates(payload)})
+        elif method == 'POST' and parts == ['apply']:
+            await self.send_json(writer, 200, {'updated': await self.apply(payload)})
+        else:
+            raise ServiceError(404, f"Unknown endpoint {method} {path}")
+
+    def get_job(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(404, f"Unknown job {job_id}")
+        return job
+
+    def delete_job(self, job):
+        if job.status == 'running':
+            raise ServiceError(409, f"Job {job.id} is still running")
+        if any(other.status == 'running' and other.source_job is job for other in self.jobs.values()):
+            raise ServiceError(409, f"Job {job.id} is in use by a running job")
+        if job.result is not None:
+            job.result.close()
+        del self.jobs[job.id]
+
+    def require_dir(self, payload, key):
+        path = payload.get(key)
+        if not path or not os.path.isdir(path):
+            raise ServiceError(400, f"'{key}' must be an existing directory")
+        return os.path.realpath(path)
+
+    def require_extensions(self, payload):
+        extensions = payload.get('extensions', DEFAULT_EXTENSIONS)
+        if (not isinstance(extensions, list) or not extensions
+                or not all(isinstance(ext, str) and ext.startswith('.') for ext in extensions)):
+            raise ServiceError(400, "'extensions' must be a non-empty list like [\".mp3\", \".m4b\"]")
+        return [ext.lower() for ext in extensions]
+
+    def check_claims(self, claims):
+        for other in self.jobs.values():
+            if other.status != 'running':
+                continue
+            for claim in claims:
+                for other_claim in other.claims:
+                    if paths_overlap(claim, other_claim):
+                        raise ServiceError(409, f"Job {other.id} is already running on {other_claim}")
+
+    def start_job(self, kind, root, func, claims=None, output_dir=None, source_job=None):
+        claims = claims or [root]
+        self.check_claims(claims)
+        for file_path in self.applying:
+            for claim in claims:
+                if paths_overlap(claim, file_path):
+                    raise ServiceError(409, f"A match is being applied to {file_path}")
+        job = Job(str(next(self.job_ids)), kind, root, claims, output_dir, source_job)
+        self.jobs[job.id] = job
+
+        def progress(message):
+            self.loop.call_soon_threadsafe(job.publish, message)
+
+        async def run():
+            try:
+                job.result = await self.loop.run_in_executor(self.pool, func, progress)
+                job.status = 'done'
+            except Exception as e:
+                print(f"Job {job.id} failed: {e}")
+                job.status = 'failed'
+                job.error = str(e)
+            finally:
+                job.publish()
+
+        task = self.loop.create_task(run())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return job
+
+    def start_scan(self, payload):
+        input_dir = self.require_dir(payload, 'input_dir')
+        extensions = self.require_extensions(payload)
+        source = payload.get('source', "Open Library")
+        api_key = payload.get('api_key')
+        return self.start_job('scan', input_dir,
+                              lambda progress: scan_library(input_dir, extensions, source, api_key, progress))
+
+    def start_plan(self, payload):
+        input_dir = self.require_dir(payload, 'input_dir')
+        output_dir = payload.get('output_dir') or input_dir
+        if not isinstance(output_dir, str):
+            raise ServiceError(400, "'output_dir' must be a path")
+        output_dir = os.path.realpath(output_dir)
+        extensions = self.require_extensions(payload)
+        pattern = payload.get('pattern', DEFAULT_PATTERN)
+
+        def plan(progress):
+            moves = SpillDict()
+            for old_path, new_path in plan_library(input_dir, extensions, pattern, output_dir):
+                moves[old_path] = new_path
+                if len(moves) % 100 == 0:
+                    progress(f"Planned {len(moves)} files")
+            progress(f"Planned {len(moves)} files")
+            return moves
+
+        return self.start_job('plan', input_dir, plan, output_dir=output_dir)
+
+    def start_execute(self, payload):
+        plan_job = self.get_job(str(payload.get('plan_job')))
+        if plan_job.kind != 'plan' or plan_job.status != 'done':
+            raise ServiceError(409, f"Job {plan_job.id} is not a finished plan")
+
+        def execute(progress):
+            moved = SpillDict()
+            for old_path, planned_path in plan_job.result.items():
+                try:
+                    moved[old_path] = move_file(old_path, planned_path)
+                except Exception as e:
+                    print(f"Error moving {old_path}: {e}")
+                    moved[old_path] = {'error': str(e)}
+                if len(moved) % 100 == 0:
+                    progress(f"Moved {len(moved)} files")
+            progress(f"Moved {len(moved)} files")
+            return moved
+
+        return self.start_job('execute', plan_job.root, execute, claims=[plan_job.root, plan_job.output_dir],
+                              output_dir=plan_job.output_dir, source_job=plan_job)
+
+    async def candidates(self, payload):
+        source = payload.get('source', "Open Library")
+        api_key = payload.get('api_key')
+        for key in ('file_path', 'title', 'author'):
+            if key in payload and not isinstance(payload[key], str):
+                raise ServiceError(400, f"'{key}' must be a string")
+        if payload.get('file_path'):
+            func = partial(find_file_matches, payload['file_path'], source, api_key)
+        elif payload.get('title'):
+            func = partial(find_matches, payload['title'], payload.get('author', ''), source, api_key)
+        else:
+            raise ServiceError(400, "Either 'file_path' or 'title' is required")
+        return await self.loop.run_in_executor(self.pool, func)
+
+    async def apply(self, payload):
+        file_path = payload.get('file_path')
+        if not isinstance(file_path, str) or not os.path.isfile(file_path):
+            raise ServiceError(400, "'file_path' must be an existing file")
+        match = payload.get('match')
+        if (not isinstance(match, dict) or not isinstance(match.get('source'), str)
+                or not isinstance(match.get('metadata') or {}, dict)):
+            raise ServiceError(400, "'match' must be a match object as returned by scan or candidates")
+        file_path = os.path.realpath(file_path)
+        if file_path in self.applying:
+            raise ServiceError(409, f"A match is already being applied to {file_path}")
+        self.check_claims([file_path])
+
+        def apply_match():
+            book_metadata = resolve_book_metadata(match)
+            if not book_metadata:
+                raise ServiceError(502, "Failed to fetch book metadata")
+            cover = fetch_cover(book_metadata) if payload.get('embed_cover', True) else None
+            return update_metadata(file_path, book_metadata, payload.get('set_title', False), cover)
+
+        self.applying.add(file_path)
+        try:
+            return await self.loop.run_in_executor(self.pool, apply_match)
+        finally:
+            self.applying.discard(file_path)
+
+    async def send_json(self, writer, status, data):
+        body = json.dumps(data).encode()
+        writer.write(f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    async def send_chunk(self, writer, data):
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        await writer.drain()
+
+    async def stream_events(self, writer, job):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        while True:
+            changed = job.changed
+            await self.send_chunk(writer, f"data: {json.dumps(job.to_dict())}\n\n".encode())
+            if job.status != 'running':
+                break
+            await changed.wait()
+        await self.send_chunk(writer, b"")
+
+    async def stream_result(self, writer, job):
+        if job.status != 'done':
+            raise ServiceError(409, f"Job {job.id} is {job.status}")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        for key, value in job.result.items():
+            await self.send_chunk(writer, (json.dumps({'file_path': key, 'value': value}) + "\n").encode())
+        await self.send_chunk(writer, b"")
+
+def run_service(host, port):
+    token = os.environ.get(SERVICE_TOKEN_ENV) or None
+    if token is None and host not in ('127.0.0.1', 'localhost', '::1'):
+        print(f"Warning: serving on {host} without {SERVICE_TOKEN_ENV}, anyone who can reach the port can move files")
+    asyncio.run(OrganizerService(token=token).serve(host, port))
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = AudiobookOrganizer()
-    window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Audiobook File Organizer")
+    parser.add_argument('--serve', action='store_true', help="run the HTTP/JSON service instead of the GUI")
+    parser.add_argument('--host', default=SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=SERVICE_PORT)
+    args, qt_args = parser.parse_known_args()
+    if args.serve:
+        run_service(args.host, args.port)
+    else:
+        app = QApplication(sys.argv[:1] + qt_args)
+        window = AudiobookOrganizer()
+        window.show()
+        sys.exit(app.exec())
\ No newline at end of file
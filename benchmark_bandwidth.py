@@ -0,0 +1,179 @@
+import os
+import gzip
+import json
+import random
+import string
+import argparse
+import threading
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import requests
+import audiobook_organizer as organizer
+
+def random_text(length):
+    return ''.join(random.choice(string.ascii_letters + ' ') for _ in range(length))
+
+def build_docs(doc_count):
+    random.seed(1)
+    docs = []
+    for idx in range(doc_count):
+        docs.append({
+            'key': f'/works/OL{idx}W',
+            'title': f'Book {idx}',
+            'author_name': ['Some Author'],
+            'author_key': ['OL1A'],
+            'first_publish_year': 1990,
+            'cover_i': 1000 + idx,
+            'edition_count': 40,
+            'edition_key': [f'OL{idx}{n}M' for n in range(40)],
+            'isbn': [f'{random.randrange(10**12, 10**13)}' for _ in range(60)],
+            'publisher': [random_text(15) for _ in range(20)],
+            'publish_date': [random_text(10) for _ in range(20)],
+            'subject': [random_text(12) for _ in range(50)],
+            'language': ['eng'],
+            'ia': [random_text(20) for _ in range(10)]
+        })
+    return docs
+
+def build_volumes(volume_count):
+    random.seed(2)
+    volumes = []
+    for idx in range(volume_count):
+        volumes.append({
+            'kind': 'books#volume',
+            'id': f'vol{idx}',
+            'etag': random_text(11),
+            'selfLink': f'https://www.googleapis.com/books/v1/volumes/vol{idx}',
+            'volumeInfo': {
+                'title': f'Book {idx}',
+                'authors': ['Some Author'],
+                'publisher': random_text(20),
+                'publishedDate': '1990-01-01',
+                'description': random_text(1500),
+                'industryIdentifiers': [{'type': 'ISBN_13', 'identifier': f'{random.randrange(10**12, 10**13)}'}],
+                'pageCount': 300,
+                'categories': [random_text(12) for _ in range(3)],
+                'imageLinks': {'smallThumbnail': f'http://books.google.com/books/content?id=vol{idx}&zoom=5',
+                               'thumbnail': f'http://books.google.com/books/content?id=vol{idx}&zoom=1'},
+                'language': 'en',
+                'previewLink': f'http://books.google.com/books?id=vol{idx}&printsec=frontcover',
+                'infoLink': f'http://books.google.com/books?id=vol{idx}',
+                'canonicalVolumeLink': f'https://books.google.com/books/about/Book.html?id=vol{idx}'
+            },
+            'saleInfo': {'country': 'US', 'saleability': 'NOT_FOR_SALE', 'isEbook': False},
+            'accessInfo': {'country': 'US', 'viewability': 'NO_PAGES', 'embeddable': False,
+                           'webReaderLink': f'http://play.google.com/books/reader?id=vol{idx}'},
+            'searchInfo': {'textSnippet': random_text(200)}
+        })
+    return volumes
+
+def parse_fields(fields):
+    tree = {}
+    stack = [tree]
+    name = ''
+    for char in fields + ',':
+        if char in ',()':
+            if name:
+                node = stack[-1]
+                for part in name.split('/'):
+                    node = node.setdefault(part, {})
+                if char == '(':
+                    stack.append(node)
+            if char == ')':
+                stack.pop()
+            name = ''
+        else:
+            name += char
+    return tree
+
+def project(value, tree):
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+
+class StubHandler(BaseHTTPRequestHandler):
+    docs = []
+    work = {}
+    volumes = []
+    stats = {'requests': 0, 'bytes': 0}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == '/search.json':
+            docs = self.docs[:int(query.get('limit', [len(self.docs)])[0])]
+            if 'fields' in query:
+                fields = query['fields'][0].split(',')
+                docs = [{field: doc[field] for field in fields if field in doc} for doc in docs]
+            body = {'numFound': len(self.docs), 'docs': docs}
+        elif url.path == '/books/v1/volumes':
+            items = self.volumes[:min(int(query.get('maxResults', [10])[0]), 40)]
+            body = {'kind': 'books#volumes', 'totalItems': len(self.volumes), 'items': items}
+            if 'fields' in query:
+                body = project(body, parse_fields(query['fields'][0]))
+        else:
+            body = self.work
+        data = json.dumps(body).encode()
+        compressed = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if compressed:
+            data = gzip.compress(data)
+        self.stats['requests'] += 1
+        self.stats['bytes'] += len(data)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def baseline_search(base_url, title, accept_encoding):
+    headers = {'Accept-Encoding': accept_encoding}
+    query = f'title:"{title}"'
+    data = requests.get(f"{base_url}/search.json?q={query.replace(' ', '+')}", headers=headers).json()
+    for doc in data.get('docs', [])[:5]:
+        requests.get(f"{base_url}/works/{doc['key'].split('/')[-1]}.json", headers=headers).json()
+
+def baseline_google_books(base_url, title, accept_encoding):
+    headers = {'Accept-Encoding': accept_encoding}
+    requests.get(f"{base_url}/books/v1/volumes", params={'q': f'intitle:"{title}"', 'key': 'stub'},
+                 headers=headers).json()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure bytes and round-trips per Open Library and Google Books lookup "
+                                                 "against a local stub server")
+    parser.add_argument('--docs', type=int, default=100, help="documents the stub returns for an unlimited search")
+    parser.add_argument('--volumes', type=int, default=40, help="volumes the stub holds for a Google Books search")
+    args = parser.parse_args()
+    StubHandler.docs = build_docs(args.docs)
+    StubHandler.volumes = build_volumes(args.volumes)
+    StubHandler.work = {'title': 'Book 0', 'authors': [{'name': 'Some Author'}], 'covers': [1000],
+                        'description': random_text(2000), 'subjects': [random_text(12) for _ in range(50)]}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    organizer.OPEN_LIBRARY_SEARCH_URL = f"{base_url}/search.json"
+    organizer.GOOGLE_BOOKS_VOLUMES_URL = f"{base_url}/books/v1/volumes"
+    runs = [
+        ('Open Library baseline (identity)', lambda: baseline_search(base_url, 'Book', 'identity')),
+        ('Open Library baseline (gzip)', lambda: baseline_search(base_url, 'Book', 'gzip')),
+        ('Open Library projected query', lambda: organizer.search_open_library('Book')),
+        ('Google Books baseline (identity)', lambda: baseline_google_books(base_url, 'Book', 'identity')),
+        ('Google Books baseline (gzip)', lambda: baseline_google_books(base_url, 'Book', 'gzip')),
+        ('Google Books projected query', lambda: organizer.search_google_books('Book', api_key='stub'))
+    ]
+    for name, run in runs:
+        StubHandler.stats.update(requests=0, bytes=0)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            run()
+        print(f"{name}: {StubHandler.stats['requests']} requests, {StubHandler.stats['bytes']} bytes")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
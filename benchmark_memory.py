@@ -0,0 +1,106 @@
+import sys
+import os
+import argparse
+import resource
+import subprocess
+import tempfile
+import contextlib
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide6.QtWidgets import QApplication, QListWidget, QListView
+import audiobook_organizer as organizer
+
+PATTERN = "{artist}/{album}/{title}/{title}.{ext}"
+
+def create_library(root, file_count, files_per_dir=500):
+    for idx in range(file_count):
+        dir_path = os.path.join(root, f"Author {idx // files_per_dir:05d}")
+        if idx % files_per_dir == 0:
+            os.makedirs(dir_path, exist_ok=True)
+        open(os.path.join(dir_path, f"Author {idx // files_per_dir:05d} - Book {idx:07d}.mp3"), 'wb').close()
+
+def stub_file_matches(file_path, source, api_key=None):
+    title, author = organizer.extract_title_and_author_from_filename(os.path.basename(file_path))
+    matches = []
+    for idx in range(organizer.MAX_SEARCH_RESULTS):
+        book_metadata = organizer.open_library_book_metadata(title, [author], 1990 + idx, cover_id=idx)
+        matches.append((f"{title} by {author} ({1990 + idx})",
+                        {'source': 'Open Library', 'olid': f'OL{idx}W', 'metadata': book_metadata}))
+    return matches
+
+def plan_baseline(input_dir):
+    output_dir = os.path.join(input_dir, 'organized')
+    files = []
+    for root, _, filenames in os.walk(input_dir):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in ['.mp3']:
+                files.append(os.path.join(root, filename))
+    metadata = [organizer.extract_metadata(file_path) for file_path in files]
+    plan = [(file_path, organizer.generate_new_path(file_path, PATTERN, output_dir, meta))
+            for file_path, meta in zip(files, metadata)]
+    return len(plan)
+
+def plan_streaming(input_dir):
+    plan = organizer.SpillDict()
+    for file_path, new_path in organizer.plan_library(input_dir, ['.mp3'], PATTERN,
+                                                      os.path.join(input_dir, 'organized')):
+        plan[file_path] = new_path
+    return len(plan)
+
+def scan_baseline(input_dir):
+    files = []
+    for root, _, filenames in os.walk(input_dir):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in ['.mp3']:
+                files.append(os.path.join(root, filename))
+    metadata_matches = {}
+    for file_path in files:
+        metadata = organizer.extract_metadata(file_path)
+        if metadata['artist'] == 'Unknown' or metadata['title'] == 'Unknown' or metadata['album'] == 'Unknown':
+            metadata_matches[file_path] = stub_file_matches(file_path, "Open Library")
+    review_list = QListWidget()
+    # one bulk call: per-item setData/addItem trips a None refcount bug in some PySide6 wheels
+    review_list.addItems([os.path.basename(file_path) for file_path in metadata_matches.keys()])
+    return review_list.count()
+
+def scan_streaming(input_dir):
+    organizer.find_file_matches = stub_file_matches
+    model = organizer.ReviewListModel()
+    model.set_matches(organizer.scan_library(input_dir, ['.mp3'], "Open Library"))
+    review_list = QListView()
+    review_list.setUniformItemSizes(True)
+    review_list.setModel(model)
+    return model.rowCount()
+
+WORKLOADS = {
+    'plan': {'baseline': plan_baseline, 'streaming': plan_streaming},
+    'scan': {'baseline': scan_baseline, 'streaming': scan_streaming}
+}
+
+def run_mode(workload, mode, input_dir):
+    app = QApplication([])
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        count = WORKLOADS[workload][mode](input_dir)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{workload} {mode}: {count} files, peak RSS {peak_kb / 1024:.1f} MiB", flush=True)
+    os._exit(0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure peak memory of the scan and plan pipelines")
+    parser.add_argument('--files', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--workload', choices=list(WORKLOADS), nargs='+', default=list(WORKLOADS))
+    parser.add_argument('--mode', choices=['baseline', 'streaming'])
+    parser.add_argument('--input-dir')
+    args = parser.parse_args()
+    if args.mode:
+        run_mode(args.workload[0], args.mode, args.input_dir)
+        return
+    for file_count in args.files:
+        with tempfile.TemporaryDirectory() as input_dir:
+            create_library(input_dir, file_count)
+            for workload in args.workload:
+                for mode in ['baseline', 'streaming']:
+                    subprocess.run([sys.executable, __file__, '--workload', workload, '--mode', mode,
+                                    '--input-dir', input_dir], check=True)
+
+if __name__ == "__main__":
+    main()
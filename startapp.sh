@@ -0,0 +1,6 @@
+#!/bin/sh
+export DISPLAY=:0
+if [ "$ORGANIZER_SERVICE" = "1" ]; then
+    python3 /app/audiobook_organizer.py --serve --host 0.0.0.0 --port "${ORGANIZER_SERVICE_PORT:-8765}" &
+fi
+exec python3 /app/audiobook_organizer.py